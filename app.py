@@ -1,32 +1,86 @@
+import hashlib
 import os
-from flask import Flask, render_template, jsonify, request
-from flask_cors import CORS
+from typing import Any, Optional, Union
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import JSONProvider
 from question_manager import QuestionManager
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to Flask's stdlib json provider
+    orjson = None
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used by jsonify and request.get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # skip the bytes -> str -> bytes round trip of the base implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
 app = Flask(__name__, template_folder="templates", static_folder="static")
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Permissive CORS for local development (relaxed; restrict as needed later).
+# The policy is the same for every request, so the headers are static.
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
 
-# Enable CORS for local development (relaxed; restrict as needed later)
-CORS(app, resources={r"/*": {"origins": "*"}})
+
+@app.after_request
+def _add_cors_headers(resp: Response) -> Response:
+    """Attach the static CORS headers to every response."""
+    resp.headers.update(_CORS_HEADERS)
+    return resp
+
+
+# The index template has no per-request variables, so it is rendered once
+# (on the first request, so url_for sees the real script root) and reused.
+_INDEX_HTML: Optional[bytes] = None
+_INDEX_ETAG: Optional[str] = None
 
 
 @app.route("/")
 def index():
     """Serve the main game page."""
-    return render_template("index.html")
+    global _INDEX_HTML, _INDEX_ETAG
+    # re-render every time in debug mode so template edits show up
+    if _INDEX_HTML is None or app.debug:
+        _INDEX_HTML = render_template("index.html").encode("utf-8")
+        _INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=16).hexdigest()
+
+    resp = Response(_INDEX_HTML, mimetype="text/html")
+    resp.set_etag(_INDEX_ETAG)
+    resp.headers["Cache-Control"] = "public, max-age=300"
+    return resp.make_conditional(request)
 
 
 # Instantiate a single QuestionManager for the running app
 # Resolve questions.txt relative to this file so CWD won't break lookup
 questions_file = os.path.join(os.path.dirname(__file__), "questions.txt")
-question_manager = QuestionManager(file_path=questions_file)
+# Set QM_AUTO_RELOAD=0 in production to stop watching questions.txt for edits
+auto_reload = os.environ.get("QM_AUTO_RELOAD", "1") != "0"
+question_manager = QuestionManager(file_path=questions_file, auto_reload=auto_reload)
 
 
 @app.route("/api/question", methods=["GET"])
 def api_get_question():
     """Return a random unused question as JSON."""
     try:
-        q = question_manager.get_random_question()
-        return jsonify(q), 200
+        body = question_manager.get_random_question_json()
+        return Response(body, status=200, mimetype="application/json")
     except FileNotFoundError as e:
         return jsonify({"error": str(e)}), 500
     except ValueError as e:
@@ -36,6 +90,16 @@ def api_get_question():
         return jsonify({"error": "Internal server error", "detail": str(e)}), 500
 
 
+# /api/validate only ever returns one of two bodies; build them once.
+# Responses are created per request since Flask may mutate their headers.
+_CORRECT_BODIES = {True: b'{"correct":true}\n', False: b'{"correct":false}\n'}
+
+
+def _correct_response(correct: bool) -> Response:
+    """Return a JSON response for a validation result from prebuilt bytes."""
+    return Response(_CORRECT_BODIES[correct], status=200, mimetype="application/json")
+
+
 @app.route("/api/validate", methods=["POST"])
 def api_validate():
     """Validate an answer for a given question id.
@@ -62,7 +126,7 @@ def api_validate():
         except ValueError as ve:
             return jsonify({"error": str(ve)}), 400
 
-        return jsonify({"correct": bool(correct)}), 200
+        return _correct_response(bool(correct))
     except Exception as e:
         return jsonify({"error": "Internal server error", "detail": str(e)}), 500
 
@@ -0,0 +1,17 @@
+"""Gunicorn configuration for serving the app in production.
+
+Usage: gunicorn -c gunicorn_conf.py app:app
+
+Used-question tracking lives in each process's memory, so a single worker
+process is the default; concurrency comes from threads instead. Raise
+WEB_CONCURRENCY only after moving that state to a shared store (e.g. Redis).
+"""
+
+import os
+
+bind = os.environ.get("BIND", "127.0.0.1:5000")
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+# keep idle client connections open so requests reuse the TCP connection
+keepalive = 30
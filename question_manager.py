@@ -1,11 +1,104 @@
 import os
 import random
 import threading
+import time
 import hashlib
+import functools
+import json
 import unicodedata
 import re
+import sys
 from typing import List, Tuple, Dict, Optional
 
+# Directory containing this module; relative question file paths resolve here
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@functools.lru_cache(maxsize=None)
+def _combining_table() -> Dict[int, None]:
+    """Return a str.translate table deleting all combining code points.
+
+    Built lazily on first non-ASCII input, then cached.
+    """
+    return {cp: None for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp))}
+
+
+_NUMBER_WORDS = {
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "eleven": "11",
+    "twelve": "12",
+}
+
+# Precompiled normalization patterns. All number words are matched in a
+# single alternation pass instead of one regex substitution per word.
+_NUM_RE = re.compile(r"\b(" + "|".join(map(re.escape, _NUMBER_WORDS)) + r")\b")
+_PUNCT_RE = re.compile(r"[^0-9a-z\s]")
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_answer(s: str) -> str:
+    """Normalize an answer string for forgiving comparison.
+
+    Steps:
+    - Unicode NFKD -> strip accents
+    - Lowercase
+    - Replace common number words with digits
+    - Remove punctuation
+    - Collapse whitespace
+    """
+    # Normalize unicode and fold accents (ASCII input has none to fold)
+    if s.isascii():
+        s = s.lower()
+    else:
+        s = unicodedata.normalize("NFKD", s).translate(_combining_table()).lower()
+
+    # replace simple number words with digits (single pass)
+    s = _NUM_RE.sub(lambda m: _NUMBER_WORDS[m.group(1)], s)
+
+    # remove punctuation (keep alphanumerics and spaces)
+    s = _PUNCT_RE.sub("", s)
+
+    # collapse whitespace
+    return _WS_RE.sub(" ", s).strip()
+
+
+# Memoized variant for short inputs only. The cache is bounded by entry
+# count, so capping key length also bounds its memory use.
+_NORMALIZE_CACHE_MAX_LEN = 64
+_normalize_answer_cached = functools.lru_cache(maxsize=4096)(_normalize_answer)
+
+
+class _Question:
+    """A parsed question record with fields precomputed at load time."""
+
+    __slots__ = ("id", "question", "answer", "norm_answer", "words", "json_bytes")
+
+    def __init__(self, qid: str, question: str, answer: str, norm_answer: str) -> None:
+        self.id = qid
+        self.question = question
+        self.answer = answer
+        # answers are fixed once loaded; normalize once here
+        self.norm_answer = norm_answer
+        # tuple so callers can't mutate the cached record through it
+        self.words = tuple(question.split())
+        # pre-serialize the public payload so the API can skip JSON encoding
+        self.json_bytes = (
+            json.dumps(
+                {"id": qid, "question": question, "words": self.words},
+                separators=(",", ":"),
+            )
+            + "\n"
+        ).encode("utf-8")
+
 
 class QuestionManager:
     """Manage questions stored in a simple pipe-delimited text file.
@@ -16,45 +109,41 @@ class QuestionManager:
     - Resolves relative file paths against the module location so CWD doesn't
       affect file lookup.
     - Caches parsed questions in-memory and reloads only when the file mtime
-      changes.
-    - Uses stable IDs (SHA256 of question text) so IDs don't change when the
-      file order changes.
+      changes. The mtime is checked at most once per STAT_CHECK_INTERVAL_NS.
+      With auto_reload=False the file is only re-read by force_reload().
+    - Uses stable IDs (16-byte BLAKE2b of question text) so IDs don't change
+      when the file order changes.
     - Tracks used question IDs in an in-memory set protected by a threading.Lock
       (note: not safe across processes; use a shared store like Redis for that).
     - Normalizes answers for more forgiving validation (punctuation, accents,
       spacing, simple number-word mapping).
     """
 
-    NUMBER_WORDS = {
-        "zero": "0",
-        "one": "1",
-        "two": "2",
-        "three": "3",
-        "four": "4",
-        "five": "5",
-        "six": "6",
-        "seven": "7",
-        "eight": "8",
-        "nine": "9",
-        "ten": "10",
-        "eleven": "11",
-        "twelve": "12",
-    }
-
-    def __init__(self, file_path: str = "questions.txt") -> None:
+    NUMBER_WORDS = _NUMBER_WORDS
+
+    # minimum time between mtime checks when polling (nanoseconds)
+    STAT_CHECK_INTERVAL_NS = 1_000_000_000
+
+    def __init__(self, file_path: str = "questions.txt", auto_reload: bool = True) -> None:
         # Resolve path relative to the module file so CWD doesn't matter
         if not os.path.isabs(file_path):
-            base_dir = os.path.dirname(__file__)
-            file_path = os.path.join(base_dir, file_path)
+            file_path = os.path.join(_MODULE_DIR, file_path)
 
         self.file_path = file_path
+        self.auto_reload = auto_reload
         self._used = set()  # set of stable ids (hex strings)
+        # Guards compound updates of _used/_remaining_ids (swap-pop, reload,
+        # clear). Single reads such as len(self._used) rely on the GIL
+        # instead; free-threaded (no-GIL) builds would need those locked too.
         self._lock = threading.Lock()
 
-        # cached questions: list of dicts {id, question, answer}
-        self._questions: List[Dict[str, str]] = []
-        self._id_map: Dict[str, Dict[str, str]] = {}
-        self._mtime: Optional[float] = None
+        # cached questions: list of _Question records
+        self._questions: List[_Question] = []
+        self._id_map: Dict[str, _Question] = {}
+        # ids not yet served; kept in sync with _used for O(1) random picks
+        self._remaining_ids: List[str] = []
+        self._mtime_ns: Optional[int] = None
+        self._last_stat_check_ns = 0
 
         # initial load (will raise if missing/empty)
         self._reload_if_needed(force=True)
@@ -62,37 +151,19 @@ class QuestionManager:
     def _normalize_answer(self, s: Optional[str]) -> str:
         """Normalize an answer string for forgiving comparison.
 
-        Steps:
-        - None -> empty string
-        - Unicode NFKD -> strip accents
-        - Lowercase
-        - Replace common number words with digits
-        - Remove punctuation
-        - Collapse whitespace
+        Thin wrapper around the module-level _normalize_answer(); short
+        inputs go through the memoized variant.
         """
         if s is None:
             return ""
-
-        # Normalize unicode and fold accents
-        s = unicodedata.normalize("NFKD", str(s))
-        s = "".join(ch for ch in s if not unicodedata.combining(ch))
-        s = s.lower()
-
-        # replace simple number words with digits
-        for word, digit in self.NUMBER_WORDS.items():
-            # word boundaries
-            s = re.sub(rf"\b{re.escape(word)}\b", digit, s)
-
-        # remove punctuation (keep alphanumerics and spaces)
-        s = re.sub(r"[^0-9a-z\s]", "", s)
-
-        # collapse whitespace
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        s = str(s)
+        if len(s) <= _NORMALIZE_CACHE_MAX_LEN:
+            return _normalize_answer_cached(s)
+        return _normalize_answer(s)
 
     def _compute_id(self, question_text: str) -> str:
         """Return a stable hex id for a question text."""
-        h = hashlib.sha256()
+        h = hashlib.blake2b(digest_size=16)
         h.update(question_text.strip().encode("utf-8"))
         return h.hexdigest()
 
@@ -104,21 +175,22 @@ class QuestionManager:
         if not os.path.isfile(self.file_path):
             raise FileNotFoundError(f"Questions file not found: {self.file_path}")
 
-        parsed: List[Dict[str, str]] = []
+        parsed: List[_Question] = []
         try:
             with open(self.file_path, "r", encoding="utf-8") as fh:
-                for raw in fh:
-                    line = raw.strip()
-                    if not line:
-                        continue
-                    if "|" not in line:
-                        continue
-                    parts = line.split("|", 1)
-                    question = parts[0].strip()
-                    answer = parts[1].strip()
-                    if question and answer:
-                        _id = self._compute_id(question)
-                        parsed.append({"id": _id, "question": question, "answer": answer})
+                data = fh.read()
+            for line in data.split("\n"):
+                # blank lines and lines without a separator have an empty sep
+                question, sep, answer = line.partition("|")
+                if not sep:
+                    continue
+                question = question.strip()
+                answer = answer.strip()
+                if question and answer:
+                    _id = self._compute_id(question)
+                    parsed.append(
+                        _Question(_id, question, answer, self._normalize_answer(answer))
+                    )
         except Exception:
             raise
 
@@ -126,53 +198,77 @@ class QuestionManager:
             raise ValueError("No questions found in file")
 
         # build id map
-        id_map = {rec["id"]: rec for rec in parsed}
+        id_map = {rec.id: rec for rec in parsed}
 
-        self._questions = parsed
-        self._id_map = id_map
+        with self._lock:
+            self._questions = parsed
+            self._id_map = id_map
+            # preserve usage across reloads: only unused ids remain selectable
+            self._remaining_ids = [qid for qid in id_map if qid not in self._used]
 
     def _reload_if_needed(self, force: bool = False) -> None:
-        """Reload questions if file changed (or if force=True)."""
+        """Reload questions if file changed (or if force=True).
+
+        Without force, this is a no-op when auto_reload is disabled.
+        """
+        if not force and not self.auto_reload:
+            return
+        if not force and self._mtime_ns is not None:
+            now = time.monotonic_ns()
+            if now - self._last_stat_check_ns < self.STAT_CHECK_INTERVAL_NS:
+                return
+            self._last_stat_check_ns = now
+
         try:
-            mtime = os.path.getmtime(self.file_path)
+            mtime_ns = os.stat(self.file_path).st_mtime_ns
         except OSError:
             raise FileNotFoundError(f"Questions file not found: {self.file_path}")
 
-        if force or self._mtime is None or self._mtime != mtime:
+        if force or self._mtime_ns is None or self._mtime_ns != mtime_ns:
             # reload file
             self._load_questions_internal()
-            self._mtime = mtime
+            self._mtime_ns = mtime_ns
 
     def load_questions(self) -> List[Tuple[str, str]]:
         """Return list of (question, answer) tuples from the cached data."""
         self._reload_if_needed()
-        return [(rec["question"], rec["answer"]) for rec in self._questions]
+        return [(rec.question, rec.answer) for rec in self._questions]
 
     def force_reload(self) -> None:
         """Force reload of the questions file (public method)."""
         self._reload_if_needed(force=True)
 
+    def _pick_random_record(self) -> _Question:
+        """Pick a random unused question record and mark it as used."""
+        self._reload_if_needed()
+
+        # pick and remove a random remaining id (swap-pop keeps this O(1))
+        with self._lock:
+            remaining = self._remaining_ids
+            if not remaining:
+                raise ValueError("No more unused questions available")
+            idx = random.randrange(len(remaining))
+            chosen_id = remaining[idx]
+            remaining[idx] = remaining[-1]
+            remaining.pop()
+            self._used.add(chosen_id)
+            return self._id_map[chosen_id]
+
     def get_random_question(self) -> Dict:
         """Return a random unused question as a dict with stable id.
 
-        Dict keys: id (str), question (str), words (List[str]).
+        Dict keys: id (str), question (str), words (Tuple[str, ...]).
         NOTE: intentionally does NOT include the correct answer.
         """
-        self._reload_if_needed()
-
-        # pick from those whose id not in _used
-        available = [rec for rec in self._questions if rec["id"] not in self._used]
-        if not available:
-            raise ValueError("No more unused questions available")
+        chosen = self._pick_random_record()
+        return {"id": chosen.id, "question": chosen.question, "words": chosen.words}
 
-        chosen = random.choice(available)
+    def get_random_question_json(self) -> bytes:
+        """Return a random unused question as pre-serialized JSON bytes.
 
-        # record usage under lock
-        with self._lock:
-            self._used.add(chosen["id"])
-
-        words = chosen["question"].split()
-        return {"id": chosen["id"], "question": chosen["question"], "words": words}
+        Same payload and semantics as get_random_question().
+        """
+        return self._pick_random_record().json_bytes
 
     def validate_answer(self, question_id: str, user_answer: str) -> bool:
         """Validate the user's answer against the stored answer for a stable id.
@@ -182,15 +278,15 @@ class QuestionManager:
         """
         self._reload_if_needed()
 
-        qid = str(question_id)
-        if qid not in self._id_map:
+        qid = question_id if type(question_id) is str else str(question_id)
+        rec = self._id_map.get(qid)
+        if rec is None:
             raise KeyError("Invalid question id")
 
-        correct_answer = self._id_map[qid]["answer"]
         if user_answer is None:
             return False
 
-        norm_correct = self._normalize_answer(correct_answer)
+        norm_correct = rec.norm_answer
         norm_user = self._normalize_answer(user_answer)
 
         return norm_correct == norm_user
@@ -199,11 +295,12 @@ class QuestionManager:
         """Clear the in-memory used-questions cache (thread-safe)."""
         with self._lock:
             self._used.clear()
+            self._remaining_ids = list(self._id_map)
 
     def get_cache_size(self) -> int:
         """Return the number of used questions currently cached."""
-        with self._lock:
-            return len(self._used)
+        # len() of a set is atomic under the GIL; no lock needed
+        return len(self._used)
 
 
 __all__ = ["QuestionManager"]